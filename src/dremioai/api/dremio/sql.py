@@ -14,16 +14,17 @@
 #  limitations under the License.
 #
 
-from pydantic import BaseModel, Field
-from typing import List, Dict, Union, Optional, Any
+from pydantic import BaseModel, Field, SkipValidation
+from typing import List, Dict, Union, Optional, Any, AsyncIterator, Iterable, Tuple
 
 from enum import auto
 from datetime import datetime
-from dremioai.api.util import UStrEnum, run_in_parallel
+from contextlib import aclosing
+from dremioai.api.util import UStrEnum
 
+import numpy as np
 import pandas as pd
 import asyncio
-import itertools
 
 from dremioai.api.transport import DremioAsyncHttpClient as AsyncHttpClient
 from dremioai.config import settings
@@ -68,6 +69,9 @@ class JobState(UStrEnum):
     INVALID_STATE = auto()
 
 
+_DONE_STATES = frozenset({JobState.COMPLETED, JobState.CANCELED, JobState.FAILED})
+
+
 class QueryType(UStrEnum):
     UI_RUN = auto()
     UI_PREVIEW = auto()
@@ -123,11 +127,7 @@ class Job(BaseModel):
 
     @property
     def done(self):
-        return self.job_state in {
-            JobState.COMPLETED,
-            JobState.CANCELED,
-            JobState.FAILED,
-        }
+        return self.job_state in _DONE_STATES
 
     @property
     def succeeded(self):
@@ -146,22 +146,52 @@ class ResultSchema(BaseModel):
 class JobResults(BaseModel):
     row_count: int = Field(..., alias="rowCount")
     result_schema: Optional[List[ResultSchema]] = Field(..., alias="schema")
-    rows: List[Dict[str, Any]]
+    # rows are decoded straight from JSON, there is nothing to validate per
+    # cell and walking thousands of row dicts per page is the hot path
+    rows: SkipValidation[List[Dict[str, Any]]]
+
+    def columns(self, names: Iterable[str]) -> Dict[str, List[Any]]:
+        """Transpose the rows of this page into one list of values per name."""
+        return {name: [row.get(name) for row in self.rows] for name in names}
 
 
 class JobResultsWrapper(List[JobResults]):
     pass
 
 
+# numpy dtypes for Dremio result types that map onto one, so the column
+# arrays can be handed to pandas as-is instead of being inferred from objects
+_NUMPY_DTYPES = {
+    "INTEGER": np.int64,
+    "BIGINT": np.int64,
+    "FLOAT": np.float64,
+    "DOUBLE": np.float64,
+    "BOOLEAN": np.bool_,
+}
+
+
+def _to_column(
+    values: List[Any], type_name: str
+) -> Union[np.ndarray, pd.DatetimeIndex, List[Any]]:
+    if type_name == "TIMESTAMP":
+        # Dremio returns ISO 8601 strings, naming the format skips
+        # per-element inference, and cache parses each value once
+        return pd.to_datetime(values, format="ISO8601", cache=True)
+    dtype = _NUMPY_DTYPES.get(type_name)
+    if dtype is None or None in values:
+        # nulls are left to pandas, which picks float64 or object as before
+        return values
+    return np.asarray(values, dtype=dtype)
+
+
 class JobResultsParams(BaseModel):
     offset: Optional[int] = 0
     limit: Optional[int] = 500
 
 
 async def _fetch_results(
-    uri: str, pat: str, project_id: str, job_id: str, off: int, limit: int
+    client: AsyncHttpClient, project_id: str, job_id: str, off: int, limit: int
 ) -> JobResults:
-    client = AsyncHttpClient()
     params = JobResultsParams(offset=off, limit=limit)
     endpoint = f"/v0/projects/{project_id}" if project_id else "/api/v3"
     return await client.get(
@@ -171,6 +201,39 @@ async def _fetch_results(
     )
 
 
+async def _iter_pages(
+    client: AsyncHttpClient,
+    project_id: str,
+    job_id: str,
+    row_count: int,
+    limit: int,
+    max_concurrent_tasks: int,
+) -> AsyncIterator[Tuple[int, JobResults]]:
+    """Yield (offset, page) pairs in completion order, with at most
+    max_concurrent_tasks pages in flight."""
+    if row_count <= limit:
+        # the common single page result needs no tasks or semaphore
+        yield 0, await _fetch_results(client, project_id, job_id, 0, limit)
+        return
+
+    semaphore = asyncio.Semaphore(max_concurrent_tasks)
+
+    async def fetch(off: int) -> Tuple[int, JobResults]:
+        async with semaphore:
+            return off, await _fetch_results(client, project_id, job_id, off, limit)
+
+    tasks = [asyncio.ensure_future(fetch(off)) for off in range(0, row_count, limit)]
+    try:
+        for page in asyncio.as_completed(tasks):
+            yield await page
+    finally:
+        # a failed page must not leave the other fetches running on the
+        # client's session, which the caller is about to close
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
 async def get_results(
     project_id: str,
     qs: Union[QuerySubmission, str],
@@ -183,14 +246,19 @@ async def get_results(
         qs = QuerySubmission(id=qs)
 
     if client is None:
-        client = AsyncHttpClient()
+        async with AsyncHttpClient() as client:
+            return await get_results(project_id, qs, use_df, uri, pat, client)
 
-    delay = settings.instance().dremio.api.polling_interval
+    api = settings.instance().dremio.api
+    max_delay = api.polling_interval
+    delay = min(api.initial_polling_interval, max_delay)
 
     endpoint = f"/v0/projects/{project_id}" if project_id else "/api/v3"
     job: Job = await client.get(f"{endpoint}/job/{qs.id}", deser=Job)
     while not job.done:
+        # short jobs are picked up quickly, long ones settle at max_delay
         await asyncio.sleep(delay)
+        delay = min(delay * 2, max_delay)
         job = await client.get(f"{endpoint}/job/{qs.id}", deser=Job)
 
     if not job.succeeded:
@@ -205,36 +273,44 @@ async def get_results(
         )
         raise RuntimeError(f"Job {qs.id} failed: {emsg}")
 
-    if job.row_count == 0:
+    # row_count is optional in the job status, treat a missing one as empty
+    if not job.row_count:
         return pd.DataFrame() if use_df else JobResultsWrapper([])
 
-    limit = min(500, job.row_count)
+    limit = min(api.results_page_size, job.row_count)
 
-    results = await run_in_parallel(
-        [
-            _fetch_results(uri, pat, project_id, qs.id, off, limit)
-            for off in range(0, job.row_count, limit)
-        ]
+    pages = _iter_pages(
+        client, project_id, qs.id, job.row_count, limit, api.results_concurrency
+    )
+    async with aclosing(pages):
+        if not use_df:
+            # pages complete out of order, place each one by its offset
+            results: List[JobResults] = [None] * -(-job.row_count // limit)
+            async for off, page in pages:
+                results[off // limit] = page
+            return JobResultsWrapper(results)
+
+        # copy each page into its slot of the column lists as soon as it
+        # arrives, so only the pages in flight are held in memory
+        schema: List[ResultSchema] = []
+        columns: Dict[str, List[Any]] = {}
+        async for off, page in pages:
+            if not schema:
+                schema = page.result_schema
+                columns = {rs.name: [None] * job.row_count for rs in schema}
+            end = off + len(page.rows)
+            for name, values in page.columns(columns).items():
+                columns[name][off:end] = values
+
+    return pd.DataFrame(
+        {rs.name: _to_column(columns[rs.name], rs.type.name) for rs in schema},
+        copy=False,
     )
-    jr = JobResultsWrapper(itertools.chain(r for r in results))
-
-    if use_df:
-        df = pd.DataFrame(
-            data=itertools.chain.from_iterable(jr.rows for jr in jr),
-            columns=[rs.name for rs in jr[0].result_schema],
-        )
-        for rs in jr[0].result_schema:
-            if rs.type.name == "TIMESTAMP":
-                df[rs.name] = pd.to_datetime(df[rs.name])
-        return df
-
-    return jr
 
 
 async def run_query(
     query: Union[Query, str], use_df: bool = False
 ) -> Union[JobResultsWrapper, pd.DataFrame]:
-    client = AsyncHttpClient()
     if not isinstance(query, Query):
         engine_name = (
             settings.instance().dremio.wlm.engine_name
@@ -245,9 +321,10 @@ async def run_query(
 
     project_id = settings.instance().dremio.project_id
     endpoint = f"/v0/projects/{project_id}" if project_id else "/api/v3"
-    qs: QuerySubmission = await client.post(
-        f"{endpoint}/sql",
-        body=query.model_dump(by_alias=True, exclude_none=True),
-        deser=QuerySubmission,
-    )
-    return await get_results(project_id, qs, use_df=use_df, client=client)
+    async with AsyncHttpClient() as client:
+        qs: QuerySubmission = await client.post(
+            f"{endpoint}/sql",
+            body=query.model_dump(by_alias=True, exclude_none=True),
+            deser=QuerySubmission,
+        )
+        return await get_results(project_id, qs, use_df=use_df, client=client)
@@ -16,6 +16,7 @@
 import logging
 import asyncio
 
+from contextlib import asynccontextmanager
 from aiohttp import ClientSession, ClientResponse, ClientResponseError
 from typing import (
     AnyStr,
@@ -26,11 +27,14 @@ from typing import (
     Union,
     TextIO,
     Awaitable,
+    AsyncIterator,
     Any,
+    Self,
 )
 from pathlib import Path
 from dremioai.log import logger
 from json import loads
+import orjson
 from pydantic import BaseModel, ValidationError
 from http import HTTPStatus
 
@@ -106,11 +110,30 @@ class AsyncHttpClient:
             "Authorization": f"Bearer {token}",
             "content-type": "application/json",
         }
+        self._session: Optional[ClientSession] = None
         self.update_headers()
 
     def update_headers(self):
         pass
 
+    async def __aenter__(self) -> Self:
+        # keep one session, and so one connection pool, for all requests
+        # issued until __aexit__
+        self._session = ClientSession(middlewares=(retry_middleware,))
+        return self
+
+    async def __aexit__(self, *exc):
+        session, self._session = self._session, None
+        await session.close()
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[ClientSession]:
+        if self._session is not None:
+            yield self._session
+        else:
+            async with ClientSession(middlewares=(retry_middleware,)) as session:
+                yield session
+
     async def download(self, response: ClientResponse, file: TextIO):
         while chunk := await response.content.read(1024):
             file.write(chunk)
@@ -126,8 +149,10 @@ class AsyncHttpClient:
         try:
             if deser is not None and issubclass(deser, BaseModel):
                 if top_level_list:
-                    return [deser.model_validate(o) for o in loads(js)]
+                    return [deser.model_validate(o) for o in orjson.loads(js)]
                 return deser.model_validate_json(js)
+            if deser is None:
+                return orjson.loads(js)
             return loads(js, object_hook=deser)
         except ValidationError as e:
             logger().error(
@@ -175,7 +200,7 @@ class AsyncHttpClient:
         file: Optional[TextIO] = None,
         top_level_list: bool = False,
     ):
-        async with ClientSession(middlewares=(retry_middleware,)) as session:
+        async with self.session() as session:
             self.log_request("GET", endpoint, params)
             async with session.get(
                 f"{self.uri}{endpoint}",
@@ -197,7 +222,7 @@ class AsyncHttpClient:
         top_level_list: bool = False,
         params: Dict[AnyStr, Any] = None,
     ):
-        async with ClientSession(middlewares=(retry_middleware,)) as session:
+        async with self.session() as session:
             self.log_request("POST", endpoint, params)
             async with session.post(
                 f"{self.uri}{endpoint}", params=params, headers=self.headers, json=body, ssl=False
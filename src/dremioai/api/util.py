@@ -14,7 +14,7 @@
 #  limitations under the License.
 #
 
-from asyncio import Semaphore, gather
+from asyncio import Semaphore, ensure_future, gather
 from typing import List, Awaitable
 from enum import StrEnum
 
@@ -32,4 +32,12 @@ async def run_in_parallel(coroutines: List[Awaitable], max_concurrent_tasks: int
         async with semaphore:
             return await coroutine
 
-    return await gather(*(sem_task(coroutine) for coroutine in coroutines))
+    tasks = [ensure_future(sem_task(coroutine)) for coroutine in coroutines]
+    try:
+        return await gather(*tasks)
+    finally:
+        # on the first failure cancel the rest instead of leaving them running
+        # against resources (e.g. a shared http session) the caller releases
+        for task in tasks:
+            task.cancel()
+        await gather(*tasks, return_exceptions=True)
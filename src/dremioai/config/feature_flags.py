@@ -16,6 +16,7 @@
 import logging
 from contextvars import ContextVar
 from enum import StrEnum
+from functools import lru_cache
 from typing import Optional, Any, Self, ClassVar
 from dremioai import log
 import ldclient
@@ -96,6 +97,7 @@ class FeatureFlagManager:
         if cls._instance and cls._instance._client:
             cls._instance._client.close()
         cls._instance = None
+        cls._context_for.cache_clear()
 
     def is_enabled(self) -> bool:
         return self._client is not None and self._client.is_initialized()
@@ -108,9 +110,11 @@ class FeatureFlagManager:
         Falls back to the same single "mcp-server" context used before
         this change.
         """
-        project_id = self._project_id.get()
-        org_id = self._org_id.get()
+        return self._context_for(self._project_id.get(), self._org_id.get())
 
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _context_for(project_id: str | None, org_id: str | None) -> ldclient.Context:
         if not project_id and not org_id:
             return ldclient.Context.create("mcp-server")
 
@@ -137,12 +141,17 @@ class FeatureFlagManager:
             state, level = "enabled", logging.DEBUG
             if self._client is not None:
                 state, level = "initialized", logging.WARNING
-            self._log.log(
-                level,
-                f"Flag '{flag_key}' not evaluated, LaunchDarkly not {state}",
-            )
+            # get_flag runs on every flag-aware settings read, only pay for
+            # formatting the message when it will be emitted
+            if self._log.isEnabledFor(level):
+                self._log.log(
+                    level,
+                    f"Flag '{flag_key}' not evaluated, LaunchDarkly not {state}",
+                )
             return default
-        context = self._build_context()
-        value = self._client.variation(flag_key, context, default)
-        self._log.debug(f"Flag '{flag_key}' evaluated to: {value} (default: {default})")
+        value = self._client.variation(flag_key, self._build_context(), default)
+        if self._log.isEnabledFor(logging.DEBUG):
+            self._log.debug(
+                f"Flag '{flag_key}' evaluated to: {value} (default: {default})"
+            )
         return value
@@ -218,7 +218,24 @@ class ApiSettings(FlagAwareModel):
     # HTTP retry configuration
     http_retry: Optional[HttpRetry] = Field(default_factory=HttpRetry)
     polling_interval: Optional[float] = Field(
-        default=1, description="Polling interval for REST api in seconds"
+        default=1,
+        gt=0,
+        description="Maximum polling interval for REST api in seconds",
+    )
+    initial_polling_interval: Optional[float] = Field(
+        default=0.05,
+        gt=0,
+        description="Initial polling interval for REST api in seconds, doubled "
+        "on every poll until polling_interval is reached",
+    )
+    results_page_size: Optional[int] = Field(
+        default=500,
+        gt=0,
+        le=500,
+        description="Rows fetched per job results request (Dremio allows at most 500)",
+    )
+    results_concurrency: Optional[int] = Field(
+        default=8, gt=0, description="Maximum job results requests in flight"
     )
 
 
@@ -243,7 +260,7 @@ class Dremio(FlagAwareModel):
     raw_project_id: Annotated[Optional[ProjectId], NoFlag()] = Field(default=None, alias="project_id")
     enable_search: Optional[bool] = Field(
         default=False,
-        alias=AliasChoices("enable_search", "enable_experimental"),
+        validation_alias=AliasChoices("enable_search", "enable_experimental"),
         description="enable experimental tools",
     )
     oauth2: Optional[OAuth2] = None
@@ -352,19 +369,19 @@ class OpenAi(BaseModel):
     api_key: Annotated[str, AfterValidator(_resolve_token_file)] = None
     model: Optional[str] = Field(default="gpt-4o")
     org: Optional[str] = Field(default=None)
-    model_config = ConfigDict(validate_assignment=True)
+    model_config = ConfigDict(validate_assignment=True, defer_build=True)
 
 
 class Ollama(BaseModel):
     model: Optional[str] = Field(default="llama3.1")
-    model_config = ConfigDict(validate_assignment=True)
+    model_config = ConfigDict(validate_assignment=True, defer_build=True)
 
 
 class LangChain(BaseModel):
     llm: Optional[Model] = None
     openai: Optional[OpenAi] = Field(default_factory=OpenAi)
     ollama: Optional[Ollama] = Field(default=None)
-    model_config = ConfigDict(validate_assignment=True)
+    model_config = ConfigDict(validate_assignment=True, defer_build=True)
 
 
 class Prometheus(BaseModel):
@@ -388,13 +405,13 @@ class MCPServer(BaseModel):
     command: Annotated[str, AfterValidator(_resolve_executable)]
     args: Optional[List[str]] = Field(default_factory=list)
     env: Optional[Dict[str, str]] = Field(default_factory=dict)
-    model_config = ConfigDict(validate_assignment=True)
+    model_config = ConfigDict(validate_assignment=True, defer_build=True)
 
 
 class Anthropic(BaseModel):
     api_key: Annotated[str, AfterValidator(_resolve_token_file)] = None
     chat_model: Optional[str] = Field(default=None)
-    model_config = ConfigDict(validate_assignment=True)
+    model_config = ConfigDict(validate_assignment=True, defer_build=True)
 
 
 class BeeAI(BaseModel):
@@ -403,7 +420,7 @@ class BeeAI(BaseModel):
     anthropic: Optional[Anthropic] = Field(default=None)
     openai: Optional[OpenAi] = Field(default=None)
     ollama: Optional[Ollama] = Field(default=None)
-    model_config = ConfigDict(validate_assignment=True)
+    model_config = ConfigDict(validate_assignment=True, defer_build=True)
 
 
 class Settings(FlagAwareMixin, BaseSettings):
@@ -581,6 +598,27 @@ async def run_with(
     return await _call()
 
 
+try:
+    from yaml import CSafeDumper as _BaseDumper
+except ImportError:  # libyaml bindings are not available
+    from yaml import SafeDumper as _BaseDumper
+
+
+# a private subclass, so the representer below does not change PyYAML's shared
+# dumpers for the rest of the process
+class _SettingsDumper(_BaseDumper):
+    pass
+
+
+add_representer(
+    str,
+    lambda dumper, data: dumper.represent_scalar(
+        "tag:yaml.org,2002:str", data, style=('"' if "@" in data else None)
+    ),
+    Dumper=_SettingsDumper,
+)
+
+
 def write_settings(
     cfg: Path = None, inst: Settings = None, dry_run: bool = False
 ) -> str | None:
@@ -593,17 +631,11 @@ def write_settings(
     d = inst.model_dump(
         exclude_none=True, mode="json", exclude_unset=True, by_alias=True
     )
-    add_representer(
-        str,
-        lambda dumper, data: dumper.represent_scalar(
-            "tag:yaml.org,2002:str", data, style=('"' if "@" in data else None)
-        ),
-    )
     if dry_run:
-        return dump(d)
+        return dump(d, Dumper=_SettingsDumper)
 
     if not cfg.exists() or not cfg.parent.exists():
         cfg.parent.mkdir(parents=True, exist_ok=True)
 
     with cfg.open("w") as f:
-        dump(d, f)
+        dump(d, f, Dumper=_SettingsDumper)
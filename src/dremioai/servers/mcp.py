@@ -32,6 +32,7 @@ from shutil import which
 from typing import Annotated, Any, Dict, List, Optional, Tuple, Union
 
 import jwt
+import orjson
 import uvicorn
 from click import Choice
 from mcp.cli.claude import get_claude_config_path
@@ -791,7 +792,7 @@ def create_default_mcpserver_config() -> Dict[str, Any]:
 def create_default_config_helper(dry_run: bool):
     cc = get_claude_config_path()
     dcmp = {"Dremio": create_default_mcpserver_config()}
-    c = load(cc.open()) if cc.exists() else {"mcpServers": {}}
+    c = orjson.loads(cc.read_bytes()) if cc.exists() else {"mcpServers": {}}
     c.setdefault("mcpServers", {}).update(dcmp)
     if dry_run:
         pp(c)
@@ -800,9 +801,8 @@ def create_default_config_helper(dry_run: bool):
     if not cc.exists():
         cc.parent.mkdir(parents=True, exist_ok=True)
 
-    with cc.open("w") as f:
-        jdump(c, f)
-        pp(f"Created default config file: {cc!s}")
+    cc.write_bytes(orjson.dumps(c, option=orjson.OPT_INDENT_2))
+    pp(f"Created default config file: {cc!s}")
 
 
 @cc.command("claude", help="Create a default configuration file for Claude")
@@ -14,8 +14,12 @@
 #  limitations under the License.
 #
 
+import asyncio
+import pandas as pd
 import pytest
-from dremioai.api.dremio.sql import Job
+from unittest.mock import AsyncMock, patch
+from dremioai.api.dremio import sql
+from dremioai.api.dremio.sql import Job, JobResults
 
 
 @pytest.mark.parametrize(
@@ -52,3 +56,143 @@ from dremioai.api.dremio.sql import Job
 )
 def test_basic_job(js: str):
     j = Job.model_validate_json(js)
+
+
+def _job(state: str, row_count: int = 0) -> Job:
+    return Job.model_validate(
+        {"jobState": state, "rowCount": row_count, "queryType": "REST"}
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_results_polling_backoff(mock_settings_instance):
+    api = mock_settings_instance.dremio.api
+    api.initial_polling_interval = 0.1
+    api.polling_interval = 0.5
+
+    client = AsyncMock()
+    client.get.side_effect = [_job("RUNNING")] * 5 + [_job("COMPLETED")]
+    with patch.object(sql.asyncio, "sleep", new_callable=AsyncMock) as sleep:
+        result = await sql.get_results(None, "job-id", client=client)
+
+    assert result == []
+    assert [c.args[0] for c in sleep.await_args_list] == [0.1, 0.2, 0.4, 0.5, 0.5]
+
+
+@pytest.mark.asyncio
+async def test_get_results_df_assembles_pages_in_order(mock_settings_instance):
+    schema = [{"name": "id", "type": {"name": "INTEGER"}}]
+    row_count = 1200
+
+    async def fetch_results(client, project_id, job_id, off, limit):
+        # later pages complete first
+        await asyncio.sleep((row_count - off) / 100000)
+        rows = [{"id": i} for i in range(off, min(off + limit, row_count))]
+        return JobResults.model_validate(
+            {"rowCount": row_count, "schema": schema, "rows": rows}
+        )
+
+    client = AsyncMock()
+    client.get.return_value = _job("COMPLETED", row_count)
+    with patch.object(sql, "_fetch_results", side_effect=fetch_results):
+        df = await sql.get_results(None, "job-id", use_df=True, client=client)
+
+    assert list(df.columns) == ["id"]
+    assert df["id"].dtype == "int64"
+    assert df["id"].tolist() == list(range(row_count))
+
+
+@pytest.mark.asyncio
+async def test_get_results_pages_in_offset_order(mock_settings_instance):
+    row_count = 1200
+
+    async def fetch_results(client, project_id, job_id, off, limit):
+        # later pages complete first
+        await asyncio.sleep((row_count - off) / 100000)
+        return JobResults.model_validate(
+            {"rowCount": row_count, "schema": [], "rows": [{"off": off}]}
+        )
+
+    client = AsyncMock()
+    client.get.return_value = _job("COMPLETED", row_count)
+    with patch.object(sql, "_fetch_results", side_effect=fetch_results):
+        result = await sql.get_results(None, "job-id", client=client)
+
+    assert [page.rows[0]["off"] for page in result] == [0, 500, 1000]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_df", [True, False], ids=["df", "pages"])
+async def test_get_results_failed_page_cancels_others(mock_settings_instance, use_df):
+    row_count = 1200
+    cancelled = []
+
+    async def fetch_results(client, project_id, job_id, off, limit):
+        if off == 0:
+            raise RuntimeError("page failed")
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(off)
+            raise
+
+    client = AsyncMock()
+    client.get.return_value = _job("COMPLETED", row_count)
+    with patch.object(sql, "_fetch_results", side_effect=fetch_results):
+        with pytest.raises(RuntimeError, match="page failed"):
+            await sql.get_results(None, "job-id", use_df=use_df, client=client)
+
+    assert sorted(cancelled) == [500, 1000]
+
+
+@pytest.mark.asyncio
+async def test_get_results_df_parses_timestamps(mock_settings_instance):
+    ts = ["2025-06-11 15:35:11.636", "2025-06-11 15:35:11.636", None]
+    page = JobResults.model_validate(
+        {
+            "rowCount": len(ts),
+            "schema": [{"name": "ts", "type": {"name": "TIMESTAMP"}}],
+            "rows": [{"ts": t} for t in ts],
+        }
+    )
+    client = AsyncMock()
+    client.get.return_value = _job("COMPLETED", len(ts))
+    with patch.object(sql, "_fetch_results", return_value=page):
+        df = await sql.get_results(None, "job-id", use_df=True, client=client)
+
+    # the inferred unit differs between pandas versions, only check the kind
+    assert pd.api.types.is_datetime64_dtype(df["ts"])
+    assert df["ts"][0] == df["ts"][1]
+    assert df["ts"].isna()[2]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("row_count", [None, 0], ids=["missing", "zero"])
+async def test_get_results_without_rows(mock_settings_instance, row_count):
+    client = AsyncMock()
+    client.get.return_value = Job.model_validate(
+        {"jobState": "COMPLETED", "rowCount": row_count, "queryType": "REST"}
+    )
+    with patch.object(sql, "_fetch_results") as fetch_results:
+        assert await sql.get_results(None, "job-id", client=client) == []
+        assert (await sql.get_results(None, "job-id", use_df=True, client=client)).empty
+    fetch_results.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_results_single_page(mock_settings_instance):
+    page = JobResults.model_validate(
+        {
+            "rowCount": 2,
+            "schema": [{"name": "id", "type": {"name": "INTEGER"}}],
+            "rows": [{"id": 1}, {"id": 2}],
+        }
+    )
+    client = AsyncMock()
+    client.get.return_value = _job("COMPLETED", 2)
+    with patch.object(sql, "_fetch_results", return_value=page) as fetch_results:
+        result = await sql.get_results(None, "job-id", client=client)
+
+    assert result == [page]
+    fetch_results.assert_awaited_once()
+    assert fetch_results.await_args.args[-2:] == (0, 2)
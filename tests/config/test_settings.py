@@ -14,7 +14,6 @@
 #  limitations under the License.
 #
 
-import os
 import uuid
 
 import pydantic
@@ -24,10 +23,15 @@ from pathlib import Path
 from tempfile import TemporaryDirectory
 from unittest.mock import patch
 
+from pydantic import TypeAdapter
 from pydantic_core import ValidationError
 
 from dremioai.config import settings
 from dremioai.config.tools import ToolType
+from conftest import trusted_settings
+
+# shared by the parametrized validation tests below
+_DREMIO_TA = TypeAdapter(settings.Dremio)
 
 
 def test_configure_with_no_file_works(mock_config_dir):
@@ -110,77 +114,100 @@ def test_projects(project_id: str | None, error: bool):
     val = {"uri": "https://foo", "project_id": project_id}
     if error:
         try:
-            settings.Dremio.model_validate(val)
+            _DREMIO_TA.validate_python(val)
             assert False
         except:
             pass
     else:
-        d = settings.Dremio.model_validate(val)
+        d = _DREMIO_TA.validate_python(val)
         assert d.project_id == project_id or d.project_id is None and project_id is None
 
 
-def test_env_file(mock_config_dir):
-    try:
-        os.environ["DREMIOAI_DREMIO__URI"] = "https://foo"
-        os.environ["DREMIOAI_DREMIO__PAT"] = "bar"
-        os.environ["DREMIOAI_TOOLS__SERVER_MODE"] = "FOR_DATA_PATTERNS"
-        settings.configure(force=True)
-        assert settings.instance().dremio.uri == "https://foo"
-        assert settings.instance().dremio.pat == "bar"
-        assert settings.instance().tools.server_mode == ToolType.FOR_DATA_PATTERNS
-    finally:
-        os.environ.pop("DREMIOAI_DREMIO__URI", None)
-        os.environ.pop("DREMIOAI_DREMIO__PAT", None)
-        os.environ.pop("DREMIOAI_TOOLS__SERVER_MODE", None)
+def test_env_file(mock_config_dir, monkeypatch):
+    monkeypatch.setenv("DREMIOAI_DREMIO__URI", "https://foo")
+    monkeypatch.setenv("DREMIOAI_DREMIO__PAT", "bar")
+    monkeypatch.setenv("DREMIOAI_TOOLS__SERVER_MODE", "FOR_DATA_PATTERNS")
+    settings.configure(force=True)
+    assert settings.instance().dremio.uri == "https://foo"
+    assert settings.instance().dremio.pat == "bar"
+    assert settings.instance().tools.server_mode == ToolType.FOR_DATA_PATTERNS
+
+
+_AUTH_URL_CASES = [
+    (uri, project_id, iss, project_id is None, iss_override, f"{label} with {plabel}")
+    for uri, iss, label in (
+        ("https://foo", "https://foo", "custom-uri"),
+        ("https://api.dremio.cloud", "https://login.dremio.cloud", "prod"),
+        (
+            "https://api.eu.dremio.cloud",
+            "https://login.eu.dremio.cloud",
+            "prodemea",
+        ),
+        ("https://api.dev.dremio.site", "https://login.dev.dremio.site", "dev"),
+    )
+    for project_id, plabel in (
+        (None, "no-project-id"),
+        ("DREMIO_DYNAMIC", "dynamic-project-id"),
+        (str(uuid.uuid4()), "project-id"),
+    )
+    for iss_override in (None, "https://my-override")
+]
 
 
-@pytest.mark.parametrize(
-    "uri,project_id,issuer,error,iss_override",
-    [
-        pytest.param(
-            uri,
-            project_id,
-            iss,
-            project_id is None,
-            iss_override,
-            id=f"{label} with {plabel}",
+def test_auth_urls():
+    # the body is pure, so run the whole table in one item rather than paying
+    # collection and setup for every combination
+    for uri, project_id, issuer, error, iss_override, label in _AUTH_URL_CASES:
+        d = _DREMIO_TA.validate_python(
+            {
+                "uri": uri,
+                "project_id": project_id,
+                "auth_issuer_uri_override": (
+                    iss_override if iss_override and not error else None
+                ),
+            }
         )
-        for uri, iss, label in (
-            ("https://foo", "https://foo", "custom-uri"),
-            ("https://api.dremio.cloud", "https://login.dremio.cloud", "prod"),
+        if iss_override:
+            issuer = iss_override
+        auth = (
             (
-                "https://api.eu.dremio.cloud",
-                "https://login.eu.dremio.cloud",
-                "prodemea",
-            ),
-            ("https://api.dev.dremio.site", "https://login.dev.dremio.site", "dev"),
-        )
-        for project_id, plabel in (
-            (None, "no-project-id"),
-            ("DREMIO_DYNAMIC", "dynamic-project-id"),
-            (str(uuid.uuid4()), "project-id"),
+                f"{issuer}/oauth/authorize",
+                f"{issuer}/oauth/token",
+                f"{issuer}/oauth/register",
+            )
+            if not error
+            else None
         )
-        for iss_override in (None, "https://my-override")
+        issuer = issuer if not error else None
+        assert d.auth_issuer_uri == issuer, f"{label}, override={iss_override}"
+        assert d.auth_endpoints == auth, f"{label}, override={iss_override}"
+
+
+@pytest.mark.parametrize(
+    "field,value",
+    [
+        (field, value)
+        for field in ("polling_interval", "initial_polling_interval")
+        for value in (0, -1)
     ],
 )
-def test_auth_urls(
-    uri: str, project_id: str | None, issuer: str, error: bool, iss_override: str | None
-):
-    d = settings.Dremio.model_validate(
-        {
-            "uri": uri,
-            "project_id": project_id,
-            "auth_issuer_uri_override": (
-                iss_override if iss_override and not error else None
-            ),
-        }
-    )
-    if iss_override:
-        issuer = iss_override
-    auth = (f"{issuer}/oauth/authorize", f"{issuer}/oauth/token", f"{issuer}/oauth/register") if not error else None
-    issuer = issuer if not error else None
-    assert d.auth_issuer_uri == issuer
-    assert d.auth_endpoints == auth
+def test_polling_intervals_must_be_positive(field: str, value: float):
+    # a zero interval would never back off and poll the job status in a loop
+    with pytest.raises(ValidationError):
+        settings.ApiSettings.model_validate({field: value})
+
+
+@pytest.mark.parametrize("size", [0, 501])
+def test_results_page_size_bounds(size: int):
+    # Dremio rejects a job results limit above 500
+    with pytest.raises(ValidationError):
+        settings.ApiSettings.model_validate({"results_page_size": size})
+
+
+def test_write_settings_leaves_shared_yaml_dumpers_alone():
+    assert settings._SettingsDumper not in (yaml.SafeDumper, yaml.Dumper)
+    assert yaml.safe_dump("@token") == "'@token'\n"
+    assert yaml.dump("@token", Dumper=settings._SettingsDumper) == '"@token"\n'
 
 
 @pytest.mark.parametrize("sdk_key", ["sdk-env-key-12345", "sdk-env-key-67890"])
@@ -213,64 +240,49 @@ def test_launchdarkly_sdk_key_from_file(tmp_path):
     assert s.launchdarkly.enabled is True
 
 
-def test_launchdarkly_defaults():
+@pytest.fixture(scope="module")
+def _base_settings():
+    """One Settings skeleton shared by the tests below, each copies the bits
+    it changes rather than building a new Settings"""
+    return trusted_settings(
+        {"dremio": {"uri": "https://test.dremio.cloud", "pat": "test-pat"}}
+    )
+
+
+def test_launchdarkly_defaults(_base_settings):
     """Test that LaunchDarkly has correct default values."""
-    s = settings.Settings.model_validate({})
+    s = _base_settings
 
     assert s.launchdarkly is not None
     assert s.launchdarkly.sdk_key is None
     assert s.launchdarkly.enabled is False
 
 
-def test_dremio_get_without_launchdarkly():
+def test_dremio_get_without_launchdarkly(_base_settings):
     """Test that get() returns config value when LaunchDarkly is not configured."""
-    s = settings.Settings.model_validate({
-        "dremio": {
-            "uri": "https://test.dremio.cloud",
-            "pat": "test-pat",
-            "allow_dml": True,
-        }
-    })
+    dremio = _base_settings.dremio.model_copy(update={"allow_dml": True})
 
-    assert s.dremio.get("allow_dml") is True
+    assert dremio.get("allow_dml") is True
 
 
-def test_dremio_get_with_launchdarkly_disabled():
+def test_dremio_get_with_launchdarkly_disabled(_base_settings):
     """Test that get() returns config value when LaunchDarkly is disabled."""
-    s = settings.Settings.model_validate({
-        "dremio": {
-            "uri": "https://test.dremio.cloud",
-            "pat": "test-pat",
-            "enable_search": True,
-        }
-    })
+    dremio = _base_settings.dremio.model_copy(update={"enable_search": True})
 
-    assert s.dremio.get("enable_search") is True
+    assert dremio.get("enable_search") is True
 
 
-def test_dremio_enable_search_fallback():
+def test_dremio_enable_search_fallback(_base_settings):
     """Test that enable_search returns config value when LD is disabled."""
-    s = settings.Settings.model_validate({
-        "dremio": {
-            "uri": "https://test.dremio.cloud",
-            "pat": "test-pat",
-            "enable_search": True
-        }
-    })
+    dremio = _base_settings.dremio.model_copy(update={"enable_search": True})
 
-    assert s.dremio.enable_search is True
-    assert s.dremio.get("enable_search") is True
+    assert dremio.enable_search is True
+    assert dremio.get("enable_search") is True
 
 
-def test_dremio_allow_dml_fallback():
+def test_dremio_allow_dml_fallback(_base_settings):
     """Test that allow_dml returns config value when LD is disabled."""
-    s = settings.Settings.model_validate({
-        "dremio": {
-            "uri": "https://test.dremio.cloud",
-            "pat": "test-pat",
-            "allow_dml": True
-        }
-    })
+    dremio = _base_settings.dremio.model_copy(update={"allow_dml": True})
 
-    assert s.dremio.allow_dml is True
-    assert s.dremio.get("allow_dml") is True
+    assert dremio.allow_dml is True
+    assert dremio.get("allow_dml") is True
@@ -18,7 +18,7 @@
 Global pytest fixtures for dremio-mcp tests.
 """
 import os
-import random
+import socket
 import uuid
 from typing import AsyncGenerator, NamedTuple
 
@@ -114,6 +114,17 @@ def mock_config_dir(temp_config_dir):
             os.environ.pop("XDG_CONFIG_HOME", None)
 
 
+def trusted_settings(d: dict) -> settings.Settings:
+    """Build Settings from a literal, already valid config dict without
+    running validation. Tests exercising validation use model_validate."""
+    kw = {}
+    if "dremio" in d:
+        kw["dremio"] = settings.Dremio.model_construct(**d["dremio"])
+    if "tools" in d:
+        kw["tools"] = settings.Tools.model_construct(**d["tools"])
+    return settings.Settings.model_construct(**kw)
+
+
 @pytest.fixture
 def mock_settings_instance():
     """Create a mock settings instance with default values"""
@@ -158,6 +169,14 @@ def mock_config_dir(temp_config_dir):
             os.environ.pop("XDG_CONFIG_HOME", None)
 
 
+def free_port() -> int:
+    """Ask the OS for an unused local port, so servers started by tests in
+    parallel xdist workers never collide."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
 def _create_logging_server(log_level="warning"):
     # Mock data for HTTP endpoints that tools will call
     mock_data = OrderedDict(
@@ -174,7 +193,7 @@ def _create_logging_server(log_level="warning"):
     )
 
     return create_pytest_logging_server_fixture(
-        mock_data=mock_data, port=8000, log_level=log_level
+        mock_data=mock_data, port=free_port(), log_level=log_level
     )
 
 
@@ -215,12 +234,12 @@ async def http_streamable_mcp_server(
     try:
         settings.configure(force=True)
         host = "127.0.0.1"
-        port = random.randrange(9000, 12000)
-        metrics_port = random.randrange(9000, 12000)
+        port = free_port()
+        metrics_port = free_port()
 
         # Ensure metrics port is different from main port
         while metrics_port == port:
-            metrics_port = random.randrange(9000, 12000)
+            metrics_port = free_port()
 
         config = {
             "dremio": {
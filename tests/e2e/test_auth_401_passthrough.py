@@ -21,7 +21,6 @@ never triggered.
 
 import io
 import json
-import random
 
 import pytest
 
@@ -34,6 +33,7 @@ from starlette.middleware import Middleware
 from mcp.types import CallToolResult
 
 from conftest import (
+    free_port,
     http_streamable_mcp_server,
     http_streamable_client_server,
 )
@@ -93,7 +93,7 @@ def _create_401_after_first_server(log_level="warning") -> LoggingServerFixture:
         routes=[Route("/{path:path}", handler, methods=["GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS"])],
         middleware=[Middleware(LoggingMiddleware, log_file=log_file)],
     )
-    port = random.randrange(12000, 15000)
+    port = free_port()
     thread, stop_event = start_server_with_app(
         app, host="127.0.0.1", port=port, log_level=log_level, name="dremio-401-mock",
     )
@@ -292,7 +292,7 @@ class TestDispatchWarning:
     """Tests for RequireAuthWithWWWAuthenticateMiddleware.dispatch() WARNING logging."""
 
     @pytest.mark.asyncio
-    async def test_dispatch_logs_warning_on_401(self, caplog):
+    async def test_dispatch_logs_warning_on_401(self, caplog, mock_settings_instance):
         middleware = RequireAuthWithWWWAuthenticateMiddleware(app=MagicMock())
 
         mock_user = MagicMock()
@@ -425,7 +425,9 @@ class TestStreamableHttpInit:
         assert mcp.settings.stateless_http is True
 
     @pytest.mark.asyncio
-    async def test_transport_logging_wraps_unauthorized_responses(self, caplog):
+    async def test_transport_logging_wraps_unauthorized_responses(
+        self, caplog, mock_settings_instance
+    ):
         with patch("dremioai.servers.mcp.tools.get_tools", return_value=[]), patch(
             "dremioai.servers.mcp.tools.get_resources", return_value=[]
         ):
@@ -447,7 +447,7 @@ def test_run_sql_safety(s: Dict[str, Union[str, bool]], dml_allowed: bool):
             assert not allowed, f'should be allowed: {s["sql"]}'
 
 
-def test_tool_decorators():
+def test_tool_decorators(mock_settings_instance):
     def normalize(expected: MCPTool, actual: MCPTool):
         for t in (expected, actual):
             t.fn = None